@@ -1,6 +1,10 @@
 # equipment_management.py
 
 from abc import ABC, abstractmethod
+import atexit
+import queue
+import sys
+import threading
 
 # Importing ABC and abstractmethod to create an abstract base class
 
@@ -21,7 +25,11 @@ class Employee(IUser):
     def __init__(self, user_id, name, skill_set):
         # Initialize employee with an ID, name, and skill set
         super().__init__(user_id, name)
-        self.skill_set = skill_set
+        # Stored as a frozenset so skill lookups are constant time;
+        # a single skill given as a string is kept whole
+        if isinstance(skill_set, str):
+            skill_set = [skill_set]
+        self.skill_set = frozenset(skill_set)
     
     # Method for checking out equipment
     def check_out_equipment(self, equipment):
@@ -39,7 +47,7 @@ class Employee(IUser):
     
     # Displays employee information
     def display_info(self):
-        return f"Employee: {self.name}, Skills: {self.skill_set}"
+        return f"Employee: {self.name}, Skills: {sorted(self.skill_set)}"
 
 # Supervisor class representing a supervisor who can generate reports
 class Supervisor(IUser):
@@ -77,21 +85,31 @@ class Buffer:
     
     def __new__(cls, employee_id):
         # Ensure only one buffer instance per employee
-        if employee_id not in cls._instances:
-            cls._instances[employee_id] = super(Buffer, cls).__new__(cls)
-        return cls._instances[employee_id]
+        instance = cls._instances.get(employee_id)
+        if instance is None:
+            instance = super(Buffer, cls).__new__(cls)
+            cls._instances[employee_id] = instance
+        return instance
     
     def __init__(self, employee_id):
+        # Skip re-initializing an existing buffer so its equipment is kept
+        if hasattr(self, "equipment_list"):
+            return
         self.employee_id = employee_id
-        self.equipment_list = []
+        self.equipment_list = {}  # Maps equipment ID to equipment
+    
+    # Drops the buffer for an employee (e.g. on logout) so it can be freed
+    @classmethod
+    def release(cls, employee_id):
+        cls._instances.pop(employee_id, None)
     
     # Adds equipment to the buffer
     def add_equipment(self, equipment):
-        self.equipment_list.append(equipment)
+        self.equipment_list[equipment.equipment_id] = equipment
     
     # Removes equipment from the buffer
     def remove_equipment(self, equipment):
-        self.equipment_list.remove(equipment)
+        self.equipment_list.pop(equipment.equipment_id, None)
 
 # Skill Verification Module checks if an employee has the required skills
 class SkillVerification:
@@ -117,6 +135,10 @@ class EquipmentCheckout:
 # Observer Pattern: Notification System for alerting supervisors
 class NotificationSystem:
     observers = []  # List to store subscribed supervisors
+    _queue = queue.Queue(maxsize=1024)  # Bounded queue of pending alerts
+    _worker = None  # Background thread that delivers queued alerts
+    _worker_lock = threading.Lock()
+    dropped_alerts = 0  # Alerts discarded because the queue was full
     
     @staticmethod
     def subscribe(observer):
@@ -125,9 +147,56 @@ class NotificationSystem:
     
     @staticmethod
     def send_alert(message):
-        # Send an alert to all subscribed supervisors
-        for observer in NotificationSystem.observers:
-            print(f"Alert sent to {observer.name}: {message}")
+        # Queue an alert so the caller is not blocked on printing;
+        # observers are read when the alert is delivered, not when sent
+        NotificationSystem._start_worker()
+        try:
+            NotificationSystem._queue.put_nowait(message)
+        except queue.Full:
+            NotificationSystem.dropped_alerts += 1
+    
+    @staticmethod
+    def flush(timeout=5.0):
+        # Wait until alerts queued so far have been delivered; returns False
+        # if the worker is not running or does not catch up within timeout
+        worker = NotificationSystem._worker
+        if worker is None:
+            return True
+        if not worker.is_alive():
+            return False
+        done = threading.Event()
+        try:
+            NotificationSystem._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+    
+    @staticmethod
+    def _start_worker():
+        # Start the delivery thread the first time an alert is sent
+        with NotificationSystem._worker_lock:
+            if NotificationSystem._worker is None:
+                NotificationSystem._worker = threading.Thread(
+                    target=NotificationSystem._drain, daemon=True
+                )
+                NotificationSystem._worker.start()
+                atexit.register(NotificationSystem.flush)
+    
+    @staticmethod
+    def _drain():
+        # Deliver queued alerts to all subscribed supervisors
+        while True:
+            message = NotificationSystem._queue.get()
+            if isinstance(message, threading.Event):
+                # Marker queued by flush(); everything before it is delivered
+                message.set()
+                continue
+            for observer in list(NotificationSystem.observers):
+                try:
+                    print(f"Alert sent to {observer.name}: {message}")
+                except Exception as error:
+                    # Skip observers that fail so the worker keeps running
+                    print(f"Alert delivery failed: {error!r}", file=sys.stderr)
 
 # Report Generation Module for generating reports on equipment usage
 class ReportGeneration:
@@ -135,6 +204,16 @@ class ReportGeneration:
     def generate_report():
         return "Generating Equipment Report..."
 
+# Menu text for the command-line interface, written to stdout in one call
+_MENU = (
+    "\nEquipment Management System\n"
+    "1. Check Out Equipment\n"
+    "2. Return Equipment\n"
+    "3. Generate Report\n"
+    "4. Exit\n"
+    "Select an option: "
+)
+
 # Command-line interface for the Equipment Management System
 if __name__ == "__main__":
     # Create instances of Employee, Supervisor, and Equipment
@@ -146,15 +225,16 @@ if __name__ == "__main__":
     
     # Command-line menu loop
     while True:
-        print("\nEquipment Management System")
-        print("1. Check Out Equipment")
-        print("2. Return Equipment")
-        print("3. Generate Report")
-        print("4. Exit")
-        choice = input("Select an option: ")
+        sys.stdout.write(_MENU)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            break  # Exit on end of input
+        choice = line.strip()
         
         if choice == "1":
             emp.check_out_equipment(equip)  # Employee checks out equipment
+            NotificationSystem.flush()  # Show any alert before the next menu
         elif choice == "2":
             emp.return_equipment(equip)  # Employee returns equipment
         elif choice == "3":